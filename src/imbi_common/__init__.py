@@ -1,21 +1,21 @@
 """Imbi common library - shared functionality for Imbi ecosystem."""
 
-from importlib import metadata
-
-from imbi_common import (
-    auth,
-    blueprints,
-    clickhouse,
-    logging,
-    models,
-    neo4j,
-    settings,
-)
+import importlib
+import types
+import typing
+
+if typing.TYPE_CHECKING:
+    from imbi_common import (
+        auth,
+        blueprints,
+        clickhouse,
+        logging,
+        models,
+        neo4j,
+        settings,
+    )
 
-try:
-    version = metadata.version('imbi-common')
-except metadata.PackageNotFoundError:
-    version = '0.0.0'
+    version: str
 
 __all__ = [
     'auth',
@@ -27,3 +27,42 @@ __all__ = [
     'settings',
     'version',
 ]
+
+# Submodules and the version are resolved on first attribute access so that
+# importing the package does not pull in every driver and dependency
+_SUBMODULES = frozenset(
+    {
+        'auth',
+        'blueprints',
+        'clickhouse',
+        'logging',
+        'models',
+        'neo4j',
+        'settings',
+    }
+)
+
+
+def _get_version() -> str:
+    from importlib import metadata
+
+    try:
+        return metadata.version('imbi-common')
+    except metadata.PackageNotFoundError:
+        return '0.0.0'
+
+
+def __getattr__(name: str) -> types.ModuleType | str:
+    value: types.ModuleType | str
+    if name in _SUBMODULES:
+        value = importlib.import_module(f'{__name__}.{name}')
+    elif name == 'version':
+        value = _get_version()
+    else:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
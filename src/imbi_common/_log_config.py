@@ -0,0 +1,38 @@
+"""Bundled logging configuration, derived from log-config.toml.
+
+log-config.toml is the source of truth; keep this module in sync with it
+so the configuration can be loaded without reading and parsing TOML at
+runtime. tests/test_logging.py fails if the two drift apart.
+
+"""
+
+import typing
+
+CONFIG: dict[str, typing.Any] = {
+    'disable_existing_loggers': False,
+    'incremental': False,
+    'version': 1,
+    'formatters': {
+        'readable': {
+            'format': (
+                '%(asctime)s.%(msecs)03d %(levelname)-12s %(name)s: '
+                '%(message)s'
+            ),
+            'datefmt': '%Y-%m-%dT%H:%M:%S',
+        },
+    },
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+            'stream': 'ext://sys.stdout',
+            'formatter': 'readable',
+        },
+    },
+    'loggers': {
+        'uvicorn': {'level': 'INFO'},
+    },
+    'root': {
+        'level': 'INFO',
+        'handlers': ['console'],
+    },
+}
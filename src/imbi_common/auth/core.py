@@ -1,16 +1,154 @@
 """Core authentication functions for password hashing and JWT tokens."""
 
+import base64
+import calendar
+import copy
 import datetime
+import functools
+import hashlib
+import hmac
+import math
+import os
 import secrets
+import threading
+import time
 import typing
 
-import argon2
 import jwt
+import orjson
 
 from imbi_common import settings
 
-# Password hashing
-password_hasher = argon2.PasswordHasher()
+if typing.TYPE_CHECKING:
+    import argon2
+
+
+@functools.cache
+def _cached_auth() -> settings.Auth:
+    """Return the singleton Auth settings, resolved once per process."""
+    return settings.get_auth_settings()
+
+
+class _JWTParams(typing.NamedTuple):
+    """Snapshot of the Auth settings used to mint and verify tokens."""
+
+    secret: bytes
+    algorithm: str
+    access_expire: int
+    refresh_expire: int
+
+
+def _jwt_params(auth_settings: settings.Auth | None) -> _JWTParams:
+    """Return the JWT parameters for ``auth_settings``.
+
+    The parameters of the singleton settings are resolved once per process.
+
+    """
+    if auth_settings is None:
+        return _default_jwt_params()
+    return _JWTParams(
+        auth_settings.jwt_secret.encode('utf-8'),
+        auth_settings.jwt_algorithm,
+        auth_settings.access_token_expire_seconds,
+        auth_settings.refresh_token_expire_seconds,
+    )
+
+
+@functools.cache
+def _default_jwt_params() -> _JWTParams:
+    return _jwt_params(_cached_auth())
+
+
+@functools.cache
+def _get_hasher() -> 'argon2.PasswordHasher':
+    """Return the Argon2id password hasher configured from settings.
+
+    argon2 is imported here rather than at module level so that processes
+    which only mint or verify tokens never load it.
+
+    """
+    import argon2
+
+    auth_settings = _cached_auth()
+    return argon2.PasswordHasher(
+        time_cost=auth_settings.password_hash_time_cost,
+        memory_cost=auth_settings.password_hash_memory_cost,
+        parallelism=auth_settings.password_hash_parallelism,
+        hash_len=auth_settings.password_hash_length,
+        salt_len=auth_settings.password_salt_length,
+        type=argon2.Type.ID,
+    )
+
+
+def __getattr__(name: str) -> 'argon2.PasswordHasher':
+    # password_hasher is kept for backwards compatibility and resolved on
+    # first access so that importing this module does not load argon2
+    if name == 'password_hasher':
+        return _get_hasher()
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+# Verified token claims cache, keyed on the token and the signing settings
+_TOKEN_CACHE_MAXSIZE = 10_000
+_TOKEN_CACHE_TTL = 60.0  # seconds
+
+_TokenCacheKey = tuple[str, bytes, str]
+
+_token_cache: dict[_TokenCacheKey, tuple[float, dict[str, typing.Any]]] = {}
+_token_cache_lock = threading.Lock()
+
+
+def _get_cached_claims(key: _TokenCacheKey) -> dict[str, typing.Any] | None:
+    """Return a copy of the cached claims for a previously verified token.
+
+    Entries are discarded once the cache TTL has elapsed or the token
+    itself has expired, so expiry is always re-checked by PyJWT.
+
+    """
+    with _token_cache_lock:
+        entry = _token_cache.get(key)
+        if entry is None:
+            return None
+        cached_until, claims = entry
+        if cached_until <= time.monotonic():
+            del _token_cache[key]
+            return None
+    return copy.deepcopy(claims)
+
+
+def _set_cached_claims(
+    key: _TokenCacheKey, claims: dict[str, typing.Any]
+) -> None:
+    """Store a copy of verified claims, evicting the oldest when full.
+
+    The entry expires after the cache TTL or when the token's ``exp`` is
+    reached, whichever comes first.
+
+    """
+    ttl = min(_TOKEN_CACHE_TTL, int(claims['exp']) - time.time())
+    claims = copy.deepcopy(claims)
+    with _token_cache_lock:
+        if len(_token_cache) >= _TOKEN_CACHE_MAXSIZE:
+            del _token_cache[next(iter(_token_cache))]
+        _token_cache[key] = (time.monotonic() + ttl, claims)
+
+
+def clear_token_cache() -> None:
+    """Discard all cached token verification results."""
+    with _token_cache_lock:
+        _token_cache.clear()
+
+
+def reset_settings_cache() -> None:
+    """Discard the auth settings, JWT parameters and hasher cached here.
+
+    The next call re-reads :func:`imbi_common.settings.get_auth_settings`,
+    so a replaced settings singleton or a patched lookup takes effect.
+
+    """
+    _cached_auth.cache_clear()
+    _default_jwt_params.cache_clear()
+    _get_hasher.cache_clear()
 
 
 def hash_password(password: str) -> str:
@@ -23,7 +161,7 @@ def hash_password(password: str) -> str:
         Hashed password string
 
     """
-    hashed: str = password_hasher.hash(password)
+    hashed: str = _get_hasher().hash(password)
     return hashed
 
 
@@ -35,13 +173,19 @@ def verify_password(password: str, password_hash: str) -> bool:
         password_hash: Hashed password to check against
 
     Returns:
-        True if password matches, False otherwise
+        True if password matches, False otherwise. Values that are not
+        Argon2 hashes are rejected without calling into argon2.
 
     """
+    if not password_hash.startswith('$argon2'):
+        return False
+
+    from argon2 import exceptions
+
     try:
-        password_hasher.verify(password_hash, password)
+        _get_hasher().verify(password_hash, password)
         return True
-    except argon2.exceptions.VerifyMismatchError:
+    except exceptions.VerifyMismatchError:
         return False
 
 
@@ -55,7 +199,310 @@ def needs_rehash(password_hash: str) -> bool:
         True if password should be rehashed, False otherwise
 
     """
-    return password_hasher.check_needs_rehash(password_hash)
+    return _get_hasher().check_needs_rehash(password_hash)
+
+
+class _Argon2Arena:
+    """Argon2 working memory shared across a batch of hash operations.
+
+    argon2-cffi lets libargon2 allocate and free the full working memory
+    (``memory_cost`` KiB) on every call.  The arena hands libargon2 the
+    same buffer through the context allocation callbacks instead, so a
+    batch pays for the allocation once.  The buffer grows to fit the
+    largest ``memory_cost`` seen and is released by :meth:`close`.
+
+    """
+
+    def __init__(self) -> None:
+        from _argon2_cffi_bindings import (  # type: ignore[import-untyped]
+            ffi,
+            lib,
+        )
+
+        self._buffer: typing.Any = None
+        self._size = 0
+        self._allocator = ffi.new_allocator(should_clear_after_alloc=False)
+        self._allocate = ffi.callback(
+            'int(uint8_t **, size_t)',
+            self._on_allocate,
+            error=lib.ARGON2_MEMORY_ALLOCATION_ERROR,
+        )
+        self._free = ffi.callback('void(uint8_t *, size_t)', self._on_free)
+
+    def __enter__(self) -> typing.Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the arena buffer."""
+        self._buffer = None
+        self._size = 0
+
+    def hash_raw(
+        self, password: bytes, salt: bytes, parameters: 'argon2.Parameters'
+    ) -> bytes:
+        """Compute a raw Argon2 hash using the arena memory.
+
+        Raises:
+            argon2.exceptions.HashingError: If libargon2 reports an error
+
+        """
+        import argon2
+        from _argon2_cffi_bindings import ffi, lib
+
+        out = ffi.new('uint8_t[]', parameters.hash_len)
+        pwd = ffi.new('uint8_t[]', password)
+        salt_buf = ffi.new('uint8_t[]', salt)
+        context = ffi.new(
+            'argon2_context *',
+            {
+                'out': out,
+                'outlen': parameters.hash_len,
+                'pwd': pwd,
+                'pwdlen': len(password),
+                'salt': salt_buf,
+                'saltlen': len(salt),
+                'secret': ffi.NULL,
+                'secretlen': 0,
+                'ad': ffi.NULL,
+                'adlen': 0,
+                't_cost': parameters.time_cost,
+                'm_cost': parameters.memory_cost,
+                'lanes': parameters.parallelism,
+                'threads': parameters.parallelism,
+                'version': parameters.version,
+                'allocate_cbk': self._allocate,
+                'free_cbk': self._free,
+                'flags': lib.ARGON2_DEFAULT_FLAGS,
+            },
+        )
+        result = argon2.low_level.core(context, parameters.type.value)
+        if result != lib.ARGON2_OK:
+            raise argon2.exceptions.HashingError(
+                argon2.low_level.error_to_str(result)
+            )
+        return bytes(ffi.buffer(out, parameters.hash_len))
+
+    def _on_allocate(self, memory: typing.Any, size: int) -> int:
+        if size > self._size:
+            self._buffer = self._allocator('uint8_t[]', size)
+            self._size = size
+        memory[0] = self._buffer
+        return 0  # ARGON2_OK
+
+    def _on_free(self, memory: typing.Any, size: int) -> None:
+        """The arena owns its buffer, so libargon2 frees are ignored."""
+
+
+def _phc_b64encode(value: bytes) -> str:
+    return base64.b64encode(value).rstrip(b'=').decode('ascii')
+
+
+def _phc_b64decode(value: str) -> bytes:
+    """Decode canonical unpadded base64, raising ValueError otherwise."""
+    decoded = base64.b64decode(value + '=' * (-len(value) % 4), validate=True)
+    if _phc_b64encode(decoded) != value:
+        raise ValueError('Non-canonical base64 encoding')
+    return decoded
+
+
+def hash_password_batch(passwords: typing.Iterable[str]) -> list[str]:
+    """Hash many passwords using Argon2id, reusing one memory arena.
+
+    Produces the same encoded hashes as :func:`hash_password`, but avoids
+    allocating the Argon2 working memory for every password.  Intended for
+    bulk imports and test fixtures.
+
+    Args:
+        passwords: Plain text passwords to hash
+
+    Returns:
+        Hashed password strings, in the same order as ``passwords``
+
+    """
+    import argon2
+
+    hasher = _get_hasher()
+    parameters = argon2.Parameters(
+        type=hasher.type,
+        version=argon2.low_level.ARGON2_VERSION,
+        salt_len=hasher.salt_len,
+        hash_len=hasher.hash_len,
+        time_cost=hasher.time_cost,
+        memory_cost=hasher.memory_cost,
+        parallelism=hasher.parallelism,
+    )
+    prefix = (
+        f'$argon2{parameters.type.name.lower()}$v={parameters.version}'
+        f'$m={parameters.memory_cost},t={parameters.time_cost}'
+        f',p={parameters.parallelism}$'
+    )
+    hashes: list[str] = []
+    with _Argon2Arena() as arena:
+        for password in passwords:
+            salt = os.urandom(parameters.salt_len)
+            raw = arena.hash_raw(password.encode('utf-8'), salt, parameters)
+            hashes.append(
+                f'{prefix}{_phc_b64encode(salt)}${_phc_b64encode(raw)}'
+            )
+    return hashes
+
+
+def verify_password_batch(
+    pairs: typing.Iterable[tuple[str, str]],
+) -> list[bool]:
+    """Verify many passwords against Argon2 hashes, reusing one arena.
+
+    Hashes that cannot be decoded here are passed to
+    :func:`verify_password` unchanged.
+
+    Args:
+        pairs: ``(password, password_hash)`` tuples to verify
+
+    Returns:
+        True for each password that matches its hash, False otherwise
+
+    """
+    import argon2
+
+    results: list[bool] = []
+    with _Argon2Arena() as arena:
+        for password, password_hash in pairs:
+            try:
+                parameters = argon2.extract_parameters(password_hash)
+                *_, salt, expected = password_hash.split('$')
+                expected_bytes = _phc_b64decode(expected)
+                raw = arena.hash_raw(
+                    password.encode('utf-8'),
+                    _phc_b64decode(salt),
+                    parameters,
+                )
+            except (
+                argon2.exceptions.HashingError,
+                argon2.exceptions.InvalidHashError,
+                ValueError,
+            ):
+                results.append(verify_password(password, password_hash))
+                continue
+            results.append(hmac.compare_digest(raw, expected_bytes))
+    return results
+
+
+# Digests for the HMAC algorithms signed without PyJWT
+_HMAC_DIGESTS: dict[str, typing.Callable[[], typing.Any]] = {
+    'HS256': hashlib.sha256,
+    'HS384': hashlib.sha384,
+    'HS512': hashlib.sha512,
+}
+
+
+def _b64url_encode(value: bytes) -> bytes:
+    return base64.urlsafe_b64encode(value).rstrip(b'=')
+
+
+@functools.cache
+def _jwt_header(algorithm: str) -> bytes:
+    """Return the base64url-encoded JWT header for ``algorithm``."""
+    return _b64url_encode(orjson.dumps({'alg': algorithm, 'typ': 'JWT'}))
+
+
+@functools.lru_cache(maxsize=16)
+def _hmac_prototype(secret: bytes, algorithm: str) -> hmac.HMAC:
+    """Return a keyed HMAC to copy for each signature.
+
+    Copying a keyed HMAC skips re-deriving the inner and outer key pads.
+    The prototype itself is never updated.
+
+    """
+    return hmac.new(secret, digestmod=_HMAC_DIGESTS[algorithm])
+
+
+@functools.lru_cache(maxsize=16)
+def _hmac_key_is_valid(secret: bytes, algorithm: str) -> bool:
+    """Return whether PyJWT accepts ``secret`` as an ``algorithm`` key.
+
+    PyJWT refuses PEM and SSH public keys as HMAC secrets.  Tokens for
+    such keys are left to PyJWT so that it raises the same error.
+
+    """
+    try:
+        jwt.get_algorithm_by_name(algorithm).prepare_key(secret)
+    except jwt.InvalidKeyError:
+        return False
+    return True
+
+
+def _normalize_time_claims(
+    claims: dict[str, typing.Any],
+) -> dict[str, typing.Any]:
+    """Convert datetime ``exp``, ``iat`` and ``nbf`` claims to epoch seconds.
+
+    Mirrors the conversion :func:`jwt.encode` applies before serializing.
+
+    """
+    for claim in ('exp', 'iat', 'nbf'):
+        value = claims.get(claim)
+        if isinstance(value, datetime.datetime):
+            claims = {**claims, claim: calendar.timegm(value.utctimetuple())}
+    return claims
+
+
+def _is_plain_json(value: typing.Any) -> bool:
+    """Return whether orjson and :func:`json.dumps` agree on ``value``.
+
+    Only exact JSON types qualify: string-keyed dicts, lists and tuples,
+    strings, booleans, ``None``, integers orjson can represent and finite
+    floats.  orjson writes ``NaN`` and infinities as ``null`` and
+    serializes types such as UUIDs and dataclasses that PyJWT rejects.
+
+    """
+    value_type = type(value)
+    if value is None or value_type is str or value_type is bool:
+        return True
+    if value_type is int:
+        in_range: bool = -(2**63) <= value < 2**64
+        return in_range
+    if value_type is float:
+        return math.isfinite(value)
+    if value_type is dict:
+        return all(
+            type(key) is str and _is_plain_json(item)
+            for key, item in value.items()
+        )
+    if value_type is list or value_type is tuple:
+        return all(_is_plain_json(item) for item in value)
+    return False
+
+
+def _encode_token(
+    claims: dict[str, typing.Any], secret: bytes, algorithm: str
+) -> str:
+    """Encode and sign JWT claims.
+
+    HMAC algorithms are signed directly using a precomputed header and a
+    pre-keyed HMAC, with the claims serialized by orjson.  The result
+    decodes to the same claims as a PyJWT token; for ASCII-only claims it
+    is byte-identical.  Other algorithms, keys PyJWT refuses for HMAC and
+    claims that are not plain JSON values are passed to :func:`jwt.encode`.
+
+    """
+    claims = _normalize_time_claims(claims)
+    if (
+        algorithm not in _HMAC_DIGESTS
+        or not _hmac_key_is_valid(secret, algorithm)
+        or not _is_plain_json(claims)
+    ):
+        token: str = jwt.encode(claims, secret, algorithm=algorithm)
+        return token
+    signing_input = (
+        _jwt_header(algorithm) + b'.' + _b64url_encode(orjson.dumps(claims))
+    )
+    mac = _hmac_prototype(secret, algorithm).copy()
+    mac.update(signing_input)
+    signature = mac.digest()
+    return (signing_input + b'.' + _b64url_encode(signature)).decode('ascii')
 
 
 def create_access_token(
@@ -75,14 +522,11 @@ def create_access_token(
         JWT token string
 
     """
-    if auth_settings is None:
-        auth_settings = settings.get_auth_settings()
+    secret, algorithm, access_expire, _ = _jwt_params(auth_settings)
 
-    jti = secrets.token_urlsafe(16)
-    now = datetime.datetime.now(datetime.UTC)
-    expires = now + datetime.timedelta(
-        seconds=auth_settings.access_token_expire_seconds
-    )
+    jti = secrets.token_hex(16)
+    now = int(time.time())
+    expires = now + access_expire
 
     claims = {
         'sub': subject,
@@ -93,10 +537,7 @@ def create_access_token(
         **(extra_claims or {}),
     }
 
-    token: str = jwt.encode(
-        claims, auth_settings.jwt_secret, algorithm=auth_settings.jwt_algorithm
-    )
-    return token
+    return _encode_token(claims, secret, algorithm)
 
 
 def create_refresh_token(
@@ -114,14 +555,11 @@ def create_refresh_token(
         JWT token string
 
     """
-    if auth_settings is None:
-        auth_settings = settings.get_auth_settings()
+    secret, algorithm, _, refresh_expire = _jwt_params(auth_settings)
 
-    jti = secrets.token_urlsafe(16)
-    now = datetime.datetime.now(datetime.UTC)
-    expires = now + datetime.timedelta(
-        seconds=auth_settings.refresh_token_expire_seconds
-    )
+    jti = secrets.token_hex(16)
+    now = int(time.time())
+    expires = now + refresh_expire
 
     claims = {
         'sub': subject,
@@ -131,10 +569,17 @@ def create_refresh_token(
         'exp': expires,
     }
 
-    token: str = jwt.encode(
-        claims, auth_settings.jwt_secret, algorithm=auth_settings.jwt_algorithm
-    )
-    return token
+    return _encode_token(claims, secret, algorithm)
+
+
+# Shared, never mutated, arguments for jwt.decode (typed as Any because
+# PyJWT's options type changed from dict to a TypedDict across releases)
+_DECODE_OPTIONS: typing.Any = {'require': ['sub', 'jti', 'type', 'exp']}
+
+
+@functools.cache
+def _decode_algorithms(algorithm: str) -> tuple[str]:
+    return (algorithm,)
 
 
 def verify_token(
@@ -142,6 +587,10 @@ def verify_token(
 ) -> dict[str, typing.Any]:
     """Decode and validate JWT token.
 
+    Successfully verified claims are cached for a short period so that
+    repeated presentations of the same token skip signature verification.
+    Failures are never cached.
+
     Args:
         token: JWT token string to decode
         auth_settings: Optional auth settings for JWT configuration
@@ -155,13 +604,130 @@ def verify_token(
         jwt.InvalidTokenError: If token is invalid
 
     """
-    if auth_settings is None:
-        auth_settings = settings.get_auth_settings()
+    secret, algorithm, _, _ = _jwt_params(auth_settings)
+
+    key = (token, secret, algorithm)
+    cached = _get_cached_claims(key)
+    if cached is not None:
+        return cached
 
     decoded: dict[str, typing.Any] = jwt.decode(
         token,
-        auth_settings.jwt_secret,
-        algorithms=[auth_settings.jwt_algorithm],
-        options={'require': ['sub', 'jti', 'type', 'exp']},
+        secret,
+        algorithms=_decode_algorithms(algorithm),
+        options=_DECODE_OPTIONS,
     )
+    _set_cached_claims(key, decoded)
     return decoded
+
+
+def _b64url_decode(value: bytes) -> bytes:
+    """Decode canonical unpadded base64url, raising ValueError otherwise."""
+    decoded = base64.b64decode(
+        value + b'=' * (-len(value) % 4), altchars=b'-_', validate=True
+    )
+    if _b64url_encode(decoded) != value:
+        raise ValueError('Non-canonical base64url encoding')
+    return decoded
+
+
+def _claims_are_valid(claims: dict[str, typing.Any]) -> bool:
+    """Return True if ``claims`` pass the checks :func:`verify_token` runs."""
+    for claim in _DECODE_OPTIONS['require']:
+        if claims.get(claim) is None:
+            return False
+    if not isinstance(claims['sub'], str) or not isinstance(
+        claims['jti'], str
+    ):
+        return False
+    now = time.time()
+    try:
+        if 'iat' in claims and int(claims['iat']) > now:
+            return False
+        if 'nbf' in claims and int(claims['nbf']) > now:
+            return False
+        if int(claims['exp']) <= now:
+            return False
+    except (OverflowError, TypeError, ValueError):
+        return False
+    return not claims.get('aud')
+
+
+def _decode_hmac_token(
+    token: str, mac: hmac.HMAC, header: bytes
+) -> dict[str, typing.Any] | None:
+    """Return the claims of a token signed with our own header and key.
+
+    Only tokens that pass every check are decoded here; ``None`` is
+    returned for anything else, including tokens with any other header,
+    so that PyJWT makes (and explains) every rejection.
+
+    """
+    try:
+        signing_input, signature = token.encode('ascii').rsplit(b'.', 1)
+        token_header, payload = signing_input.split(b'.')
+        if token_header != header:
+            return None
+        mac.update(signing_input)
+        if not hmac.compare_digest(mac.digest(), _b64url_decode(signature)):
+            return None
+        claims = orjson.loads(_b64url_decode(payload))
+    except ValueError:
+        return None
+    if not isinstance(claims, dict) or not _claims_are_valid(claims):
+        return None
+    return claims
+
+
+def _verify_or_error(
+    token: str, auth_settings: settings.Auth | None
+) -> dict[str, typing.Any] | jwt.InvalidTokenError:
+    try:
+        return verify_token(token, auth_settings)
+    except jwt.InvalidTokenError as err:
+        return err
+
+
+def verify_tokens_batch(
+    tokens: typing.Iterable[str], auth_settings: settings.Auth | None = None
+) -> list[dict[str, typing.Any] | jwt.InvalidTokenError]:
+    """Decode and validate many JWT tokens at once.
+
+    For HMAC algorithms, tokens carrying the header this module signs with
+    are checked in one loop against a single pre-keyed HMAC, skipping
+    PyJWT's per-token setup.  Any token that does not pass every check on
+    that path, and every token for other algorithms or for keys PyJWT
+    refuses, is verified with :func:`verify_token`, so rejections are
+    PyJWT's.  Results share the
+    verified claims cache with :func:`verify_token`.
+
+    Args:
+        tokens: JWT token strings to decode
+        auth_settings: Optional auth settings for JWT configuration
+            (uses singleton if not provided)
+
+    Returns:
+        For each token, in order, either its decoded claims or the
+        :class:`jwt.InvalidTokenError` describing why it was rejected
+
+    """
+    secret, algorithm, _, _ = _jwt_params(auth_settings)
+    if algorithm not in _HMAC_DIGESTS or not _hmac_key_is_valid(
+        secret, algorithm
+    ):
+        return [_verify_or_error(token, auth_settings) for token in tokens]
+
+    prototype = _hmac_prototype(secret, algorithm)
+    header = _jwt_header(algorithm)
+    results: list[dict[str, typing.Any] | jwt.InvalidTokenError] = []
+    for token in tokens:
+        key = (token, secret, algorithm)
+        claims = _get_cached_claims(key)
+        if claims is None:
+            claims = _decode_hmac_token(token, prototype.copy(), header)
+            if claims is None:
+                results.append(_verify_or_error(token, auth_settings))
+                continue
+            _set_cached_claims(key, claims)
+        results.append(claims)
+    return results
@@ -1,6 +1,14 @@
 def unwrap_as[T](typ: type[T], value: object | None) -> T:
     if value is None:
         raise ValueError('Value is unexpectedly None')
-    if isinstance(value, typ):
+    if type(value) is typ or isinstance(value, typ):
+        return value
+    raise ValueError('Value is not of expected type')
+
+
+def unwrap_as_exact[T](typ: type[T], value: object | None) -> T:
+    if value is None:
+        raise ValueError('Value is unexpectedly None')
+    if type(value) is typ:
         return value
     raise ValueError('Value is not of expected type')
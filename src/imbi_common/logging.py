@@ -1,10 +1,11 @@
 """Logging configuration for Imbi services."""
 
-import tomllib
+import copy
 import typing
-from importlib import resources
 from logging import config
 
+from imbi_common import _log_config
+
 
 # Minimal type checking for the configuration that we rely upon
 class _LoggerConfig(typing.TypedDict, total=False):
@@ -16,18 +17,18 @@ class _LoggingConfig(typing.TypedDict, total=False):
 
 
 def get_log_config() -> _LoggingConfig:
-    """Load logging configuration from bundled log-config.toml.
+    """Load the bundled logging configuration.
+
+    The configuration is maintained in log-config.toml and mirrored as a
+    Python literal in :mod:`imbi_common._log_config`, so no file is read or
+    parsed. Each call returns a fresh copy that is safe to modify.
 
     Returns:
         dict: Logging configuration dictionary suitable for
             logging.dictConfig()
 
     """
-    log_config_file = resources.files('imbi_common') / 'log-config.toml'
-    return typing.cast(
-        _LoggingConfig,
-        typing.cast(object, tomllib.loads(log_config_file.read_text())),
-    )
+    return typing.cast(_LoggingConfig, copy.deepcopy(_log_config.CONFIG))
 
 
 def configure_logging(
@@ -36,17 +37,24 @@ def configure_logging(
     """Configure logging using dictConfig.
 
     Args:
-        log_config: Optional logging config dict. If None, loads from
-            log-config.toml
-        dev: If True, sets imbi logger to DEBUG level
+        log_config: Optional logging config dict. If None, uses the
+            bundled configuration from log-config.toml
+        dev: If True, sets imbi logger to DEBUG level. The provided
+            log_config is not modified.
 
     """
     if log_config is None:
         log_config = get_log_config()
 
     if dev:
-        loggers = log_config.setdefault('loggers', {})
-        loggers.setdefault('imbi', {})
-        loggers['imbi']['level'] = 'DEBUG'
+        # Build a new config rather than mutating the caller's
+        loggers = log_config.get('loggers', {})
+        log_config = {
+            **log_config,
+            'loggers': {
+                **loggers,
+                'imbi': {**loggers.get('imbi', {}), 'level': 'DEBUG'},
+            },
+        }
 
     config.dictConfig(log_config)  # type: ignore[arg-type]
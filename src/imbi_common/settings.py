@@ -115,6 +115,13 @@ class Auth(pydantic_settings.BaseSettings):
     password_require_digit: bool = True
     password_require_special: bool = True
 
+    # Password Hashing (Argon2id, OWASP minimum profile)
+    password_hash_time_cost: int = 2
+    password_hash_memory_cost: int = 19456  # KiB (19 MiB)
+    password_hash_parallelism: int = 1
+    password_hash_length: int = 32
+    password_salt_length: int = 16
+
     # Session Configuration
     session_timeout_seconds: int = 86400  # 24 hours
     max_concurrent_sessions: int = 5
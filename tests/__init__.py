@@ -1,17 +1,81 @@
 """Test utilities and base classes for imbi-common tests."""
 
+import asyncio
 import os
+import typing
 import unittest
 
+from imbi_common import clickhouse, neo4j
 
-class Neo4jTestCase(unittest.IsolatedAsyncioTestCase):
+
+class SharedLoopTestCase(unittest.IsolatedAsyncioTestCase):
+    """IsolatedAsyncioTestCase that shares one event loop per test class.
+
+    IsolatedAsyncioTestCase creates and closes an event loop for every
+    test, which forces database drivers bound to the loop to be recreated
+    and reconnected each time. This class runs all tests of a class on a
+    single loop, so connections can be opened once in
+    ``async_set_up_class`` and closed in ``async_tear_down_class``.
+    """
+
+    _runner: typing.ClassVar[asyncio.Runner | None] = None
+
+    @classmethod
+    def setUpClass(cls):
+        """Create the shared event loop and run async_set_up_class on it."""
+        super().setUpClass()
+        cls._runner = asyncio.Runner(debug=True)
+        try:
+            cls._runner.run(cls.async_set_up_class())
+        except BaseException:
+            cls._close_runner()
+            raise
+
+    @classmethod
+    def tearDownClass(cls):
+        """Run async_tear_down_class and close the shared event loop."""
+        try:
+            if cls._runner is not None:
+                cls._runner.run(cls.async_tear_down_class())
+        finally:
+            cls._close_runner()
+            super().tearDownClass()
+
+    @classmethod
+    async def async_set_up_class(cls):
+        """Hook for class-level setup run on the shared event loop."""
+
+    @classmethod
+    async def async_tear_down_class(cls):
+        """Hook for class-level cleanup run on the shared event loop."""
+
+    @classmethod
+    def _close_runner(cls):
+        if cls._runner is not None:
+            cls._runner.close()
+            cls._runner = None
+
+    @typing.override
+    def _setupAsyncioRunner(self):
+        if self._runner is None:
+            super()._setupAsyncioRunner()
+        else:
+            self._asyncioRunner = self._runner
+
+    @typing.override
+    def _tearDownAsyncioRunner(self):
+        if self._asyncioRunner is not self._runner:
+            super()._tearDownAsyncioRunner()
+
+
+class Neo4jTestCase(SharedLoopTestCase):
     """Base class for tests requiring Neo4j connection.
 
     This class automatically handles:
     - Skipping tests when SKIP_INTEGRATION_TESTS is set
-    - Initializing Neo4j connection before each test
+    - Initializing Neo4j connection once per test class
     - Cleaning up test data after each test
-    - Closing Neo4j connection after each test
+    - Closing Neo4j connection after the last test in the class
     """
 
     @classmethod
@@ -19,28 +83,30 @@ class Neo4jTestCase(unittest.IsolatedAsyncioTestCase):
         """Skip all tests in this class if integration tests disabled."""
         if os.environ.get('SKIP_INTEGRATION_TESTS'):
             raise unittest.SkipTest('Integration tests disabled')
+        super().setUpClass()
 
-    async def asyncSetUp(self):
-        """Initialize Neo4j connection before each test."""
-        from imbi_common import neo4j
-
+    @classmethod
+    async def async_set_up_class(cls):
+        """Initialize Neo4j connection before the first test."""
         await neo4j.initialize()
 
-    async def asyncTearDown(self):
-        """Clean up test data and close connection after each test."""
-        from imbi_common import neo4j
+    @classmethod
+    async def async_tear_down_class(cls):
+        """Close Neo4j connection after the last test."""
+        await neo4j.aclose()
 
+    async def asyncTearDown(self):
+        """Clean up test data after each test."""
         await neo4j.execute_write('MATCH (n) DETACH DELETE n')
-        await neo4j.aclose()
 
 
-class ClickHouseTestCase(unittest.IsolatedAsyncioTestCase):
+class ClickHouseTestCase(SharedLoopTestCase):
     """Base class for tests requiring ClickHouse connection.
 
     This class automatically handles:
     - Skipping tests when SKIP_INTEGRATION_TESTS is set
-    - Initializing ClickHouse connection before each test
-    - Setting up schema before each test
+    - Initializing ClickHouse connection and schema once per test class
+    - Closing ClickHouse connection after the last test in the class
     """
 
     @classmethod
@@ -48,10 +114,15 @@ class ClickHouseTestCase(unittest.IsolatedAsyncioTestCase):
         """Skip all tests in this class if integration tests disabled."""
         if os.environ.get('SKIP_INTEGRATION_TESTS'):
             raise unittest.SkipTest('Integration tests disabled')
+        super().setUpClass()
 
-    async def asyncSetUp(self):
-        """Initialize ClickHouse connection and schema before each test."""
-        from imbi_common import clickhouse
-
+    @classmethod
+    async def async_set_up_class(cls):
+        """Initialize ClickHouse connection and schema before first test."""
         await clickhouse.initialize()
         await clickhouse.setup_schema()
+
+    @classmethod
+    async def async_tear_down_class(cls):
+        """Close ClickHouse connection after the last test."""
+        await clickhouse.aclose()
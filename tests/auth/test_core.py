@@ -1,10 +1,22 @@
 """Unit tests for auth.core module."""
 
+import dataclasses
 import datetime
+import enum
+import hmac
+import math
+import subprocess
+import sys
+import time
+import typing
 import unittest
+import uuid
+from unittest import mock
 
+import argon2
 import jwt
 
+from imbi_common import settings
 from imbi_common.auth import core
 
 
@@ -39,6 +51,13 @@ class TestPasswordHashing(unittest.TestCase):
         hashed = core.hash_password('test')
         self.assertFalse(core.verify_password('', hashed))
 
+    def test_verify_password_non_argon2_hash(self):
+        """Test that non-Argon2 hash values are rejected early."""
+        with mock.patch.object(core, '_get_hasher') as get_hasher:
+            for value in ('', 'not-a-hash', '$2b$12$bcrypthashvalue'):
+                self.assertFalse(core.verify_password('password', value))
+        get_hasher.assert_not_called()
+
     def test_different_hashes_for_same_password(self):
         """Test that same password produces different hashes (salt)."""
         password = 'test_password'
@@ -53,6 +72,110 @@ class TestPasswordHashing(unittest.TestCase):
         # Should not need rehash immediately after creation
         self.assertFalse(core.needs_rehash(hashed))
 
+    def test_hash_uses_configured_parameters(self):
+        """Test that hashes are created with the configured profile."""
+        hashed = core.hash_password('test_password')
+        self.assertTrue(hashed.startswith('$argon2id$v=19$m=19456,t=2,p=1$'))
+
+    def test_needs_rehash_for_other_parameters(self):
+        """Test that hashes from other parameters need rehashing."""
+        hashed = argon2.PasswordHasher(time_cost=3).hash('test_password')
+        self.assertTrue(core.verify_password('test_password', hashed))
+        self.assertTrue(core.needs_rehash(hashed))
+
+    def test_password_hasher_attribute(self):
+        """Test that the module-level password_hasher is still available."""
+        self.assertIs(core.password_hasher, core._get_hasher())
+        self.assertTrue(
+            core.verify_password(
+                'test_password', core.password_hasher.hash('test_password')
+            )
+        )
+        with self.assertRaises(AttributeError):
+            _ = core.not_an_attribute
+
+
+class TestLazyArgon2(unittest.TestCase):
+    """Test that argon2 is only loaded when passwords are hashed."""
+
+    def test_token_operations_do_not_import_argon2(self):
+        """Test that minting and verifying tokens leaves argon2 unloaded."""
+        result = subprocess.run(
+            [
+                sys.executable,
+                '-c',
+                'import sys; from imbi_common.auth import core; '
+                "core.verify_token(core.create_access_token('user')); "
+                "print('argon2' in sys.modules)",
+            ],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+        self.assertEqual(result.stdout.strip(), 'False')
+
+
+class TestPasswordHashingBatch(unittest.TestCase):
+    """Test batch password hashing and verification."""
+
+    def test_hash_password_batch_interoperates(self):
+        """Test that batch hashes verify with the scalar API."""
+        passwords = ['first_password', 'second_password', '']
+        hashes = core.hash_password_batch(passwords)
+        self.assertEqual(len(hashes), 3)
+        self.assertEqual(len(set(hashes)), 3)
+        for password, hashed in zip(passwords, hashes, strict=True):
+            self.assertTrue(core.verify_password(password, hashed))
+            self.assertFalse(core.needs_rehash(hashed))
+
+    def test_verify_password_batch(self):
+        """Test batch verification of matching and mismatched passwords."""
+        hashed = core.hash_password('secure_password_123')
+        legacy = argon2.PasswordHasher(memory_cost=65536).hash('legacy')
+        self.assertEqual(
+            core.verify_password_batch(
+                [
+                    ('secure_password_123', hashed),
+                    ('wrong_password', hashed),
+                    ('legacy', legacy),
+                ]
+            ),
+            [True, False, True],
+        )
+
+    def test_verify_password_batch_non_argon2_hash(self):
+        """Test that values that are not Argon2 hashes do not match."""
+        self.assertEqual(
+            core.verify_password_batch(
+                [('password', ''), ('password', '$2b$12$bcrypthashvalue')]
+            ),
+            [False, False],
+        )
+
+    def test_verify_password_batch_malformed_hash(self):
+        """Test that malformed Argon2 hashes fail as verify_password does."""
+        hashed = core.hash_password('password')
+        prefix, salt, digest = hashed.rsplit('$', 2)
+        for value in (
+            '$argon2id$malformed',
+            f'{prefix}$!!!$!!!',
+            f'{prefix}$$',
+            f'{prefix}${salt}${digest[:-1]}!',
+            f'{prefix}${salt}${digest[:-1]}B',
+            f'{prefix}${salt[:-1]}B${digest}',
+        ):
+            with self.subTest(value=value):
+                error = argon2.exceptions.VerificationError
+                with self.assertRaises(error):
+                    core.verify_password('password', value)
+                with self.assertRaises(error):
+                    core.verify_password_batch([('password', value)])
+
+    def test_verify_password_batch_empty(self):
+        """Test that an empty batch returns no results."""
+        self.assertEqual(core.verify_password_batch([]), [])
+        self.assertEqual(core.hash_password_batch([]), [])
+
 
 class TestJWTTokens(unittest.TestCase):
     """Test JWT token creation and verification."""
@@ -108,6 +231,18 @@ class TestJWTTokens(unittest.TestCase):
         with self.assertRaises(jwt.InvalidTokenError):
             core.verify_token('invalid.token.here')
 
+    def test_missing_required_claim_raises_exception(self):
+        """Test that tokens without a required claim are rejected."""
+        token = jwt.encode(
+            {'sub': 'user@example.com', 'exp': 2**40},
+            settings.get_auth_settings().jwt_secret,
+        )
+        with self.assertRaises(jwt.MissingRequiredClaimError):
+            core.verify_token(token)
+        self.assertEqual(
+            core._DECODE_OPTIONS, {'require': ['sub', 'jti', 'type', 'exp']}
+        )
+
     def test_tampered_token_raises_exception(self):
         """Test that tampered token raises exception."""
         token = core.create_access_token(subject='user@example.com')
@@ -116,6 +251,525 @@ class TestJWTTokens(unittest.TestCase):
             core.verify_token(tampered)
 
 
+class TestAuthSettingsResolution(unittest.TestCase):
+    """Test resolution of the default auth settings."""
+
+    def test_cached_auth_returns_singleton(self):
+        """Test that the cached settings are the settings singleton."""
+        self.assertIs(core._cached_auth(), settings.get_auth_settings())
+        self.assertIs(core._cached_auth(), core._cached_auth())
+
+    def test_default_jwt_params_snapshot(self):
+        """Test that the default JWT parameters mirror the singleton."""
+        auth_settings = settings.get_auth_settings()
+        self.assertEqual(
+            core._jwt_params(None),
+            (
+                auth_settings.jwt_secret.encode('utf-8'),
+                auth_settings.jwt_algorithm,
+                auth_settings.access_token_expire_seconds,
+                auth_settings.refresh_token_expire_seconds,
+            ),
+        )
+        self.assertIs(core._jwt_params(None), core._jwt_params(None))
+
+    def test_explicit_settings_take_precedence(self):
+        """Test that explicitly provided settings are used for signing."""
+        auth_settings = settings.Auth(jwt_secret='explicit-secret' * 3)
+        token = core.create_access_token(
+            subject='user@example.com', auth_settings=auth_settings
+        )
+        payload = core.verify_token(token, auth_settings=auth_settings)
+        self.assertEqual(payload['sub'], 'user@example.com')
+        with self.assertRaises(jwt.InvalidTokenError):
+            core.verify_token(token)
+
+    def test_reset_settings_cache(self):
+        """Test that a reset picks up replaced settings."""
+        self.addCleanup(core.reset_settings_cache)
+        core.hash_password('warm-up')
+        auth_settings = settings.Auth(
+            jwt_secret='reset-secret' * 4, password_hash_time_cost=3
+        )
+        with mock.patch.object(
+            settings, 'get_auth_settings', return_value=auth_settings
+        ):
+            core.reset_settings_cache()
+            token = core.create_access_token(subject='user@example.com')
+            hashed = core.hash_password('test_password')
+        self.assertIs(core._cached_auth(), auth_settings)
+        self.assertEqual(
+            core.verify_token(token, auth_settings=auth_settings)['sub'],
+            'user@example.com',
+        )
+        self.assertIn(',t=3,', hashed)
+
+
+class TestVerifyTokenCache(unittest.TestCase):
+    """Test caching of verified token claims."""
+
+    def setUp(self):
+        core.clear_token_cache()
+        self.addCleanup(core.clear_token_cache)
+
+    def test_repeated_verify_skips_decode(self):
+        """Test that a cached token is not decoded again."""
+        token = core.create_access_token(subject='user@example.com')
+        first = core.verify_token(token)
+        with mock.patch.object(core.jwt, 'decode') as decode:
+            second = core.verify_token(token)
+        decode.assert_not_called()
+        self.assertEqual(first, second)
+
+    def test_cached_claims_are_copies(self):
+        """Test that mutating returned claims does not affect the cache."""
+        token = core.create_access_token(subject='user@example.com')
+        core.verify_token(token)['sub'] = 'mutated'
+        self.assertEqual(core.verify_token(token)['sub'], 'user@example.com')
+
+    def test_nested_cached_claims_are_copies(self):
+        """Test that mutating nested claims does not affect the cache."""
+        token = core.create_access_token(
+            subject='user@example.com',
+            extra_claims={'roles': ['viewer'], 'org': {'id': 1}},
+        )
+        claims = core.verify_token(token)
+        claims['roles'].append('admin')
+        claims['org']['id'] = 2
+        cached = core.verify_token(token)
+        self.assertEqual(cached['roles'], ['viewer'])
+        self.assertEqual(cached['org'], {'id': 1})
+
+    def test_string_exp_is_served_from_cache(self):
+        """Test that a numeric string exp accepted by PyJWT is cacheable."""
+        token = jwt.encode(
+            {'sub': 'user', 'jti': 'abc', 'type': 'access', 'exp': str(2**40)},
+            settings.get_auth_settings().jwt_secret,
+        )
+        first = core.verify_token(token)
+        with mock.patch.object(core.jwt, 'decode') as decode:
+            self.assertEqual(core.verify_token(token), first)
+        decode.assert_not_called()
+
+    def test_failures_are_not_cached(self):
+        """Test that invalid tokens are rejected on every call."""
+        for _attempt in range(2):
+            with self.assertRaises(jwt.InvalidTokenError):
+                core.verify_token('invalid.token.here')
+        self.assertEqual(core._token_cache, {})
+
+    def test_cache_is_keyed_on_settings(self):
+        """Test that cached claims are not reused across secrets."""
+        token = core.create_access_token(subject='user@example.com')
+        core.verify_token(token)
+        other = settings.Auth(jwt_secret='other-secret' * 4)
+        with self.assertRaises(jwt.InvalidTokenError):
+            core.verify_token(token, auth_settings=other)
+
+    def test_expired_ttl_entry_is_reverified(self):
+        """Test that entries past the cache TTL are decoded again."""
+        token = core.create_access_token(subject='user@example.com')
+        core.verify_token(token)
+        with (
+            mock.patch.object(core, '_TOKEN_CACHE_TTL', -1.0),
+            mock.patch.object(core.jwt, 'decode', wraps=jwt.decode) as decode,
+        ):
+            core.clear_token_cache()
+            core.verify_token(token)
+            core.verify_token(token)
+        self.assertEqual(decode.call_count, 2)
+
+    def test_expired_token_is_not_served_from_cache(self):
+        """Test that a token past its exp claim is verified again."""
+        token = core.create_access_token(
+            subject='user@example.com',
+            extra_claims={'exp': int(time.time()) + 30},
+        )
+        core.verify_token(token)
+        deadline = time.monotonic() + 31
+        with (
+            mock.patch.object(core.time, 'monotonic', return_value=deadline),
+            mock.patch.object(core.jwt, 'decode', wraps=jwt.decode) as decode,
+        ):
+            core.verify_token(token)
+        decode.assert_called_once()
+
+    def test_oldest_entry_evicted_when_full(self):
+        """Test that the cache is bounded."""
+        tokens = [core.create_access_token(subject=str(i)) for i in range(3)]
+        with mock.patch.object(core, '_TOKEN_CACHE_MAXSIZE', 2):
+            for token in tokens:
+                core.verify_token(token)
+        self.assertEqual(len(core._token_cache), 2)
+        self.assertNotIn(tokens[0], {key[0] for key in core._token_cache})
+
+
+class TestTokenEncoding(unittest.TestCase):
+    """Test that tokens are encoded exactly as PyJWT would."""
+
+    claims: typing.ClassVar[dict[str, typing.Any]] = {
+        'sub': 'user@example.com',
+        'jti': 'abc123',
+        'type': 'access',
+        'iat': 1700000000,
+        'exp': 1700003600,
+        'role': 'admin',
+    }
+
+    def test_hmac_algorithms_match_pyjwt(self):
+        """Test that HMAC tokens are byte-identical to PyJWT output."""
+        for algorithm in ('HS256', 'HS384', 'HS512'):
+            with self.subTest(algorithm=algorithm):
+                self.assertEqual(
+                    core._encode_token(self.claims, b's' * 64, algorithm),
+                    jwt.encode(self.claims, 's' * 64, algorithm=algorithm),
+                )
+
+    def test_non_ascii_claims_round_trip(self):
+        """Test that non-ASCII claims decode to the original values."""
+        claims = {**self.claims, 'name': 'Zoë Ünïcode ✓'}
+        token = core._encode_token(claims, b's' * 64, 'HS256')
+        self.assertEqual(
+            jwt.decode(
+                token,
+                's' * 64,
+                algorithms=['HS256'],
+                options={'verify_exp': False},
+            ),
+            claims,
+        )
+
+    def test_datetime_time_claims_match_pyjwt(self):
+        """Test that datetime exp, iat and nbf become epoch seconds."""
+        issued = datetime.datetime(
+            2023, 11, 14, 22, 13, 20, tzinfo=datetime.UTC
+        )
+        claims = {
+            **self.claims,
+            'iat': issued,
+            'nbf': issued,
+            'exp': issued + datetime.timedelta(hours=1),
+        }
+        self.assertEqual(
+            core._encode_token(claims, b's' * 64, 'HS256'),
+            jwt.encode(claims, 's' * 64, algorithm='HS256'),
+        )
+        self.assertIsInstance(claims['exp'], datetime.datetime)
+
+    def test_datetime_extra_claims_round_trip(self):
+        """Test that datetime exp and nbf extra claims verify."""
+        now = datetime.datetime.now(datetime.UTC)
+        token = core.create_access_token(
+            subject='user@example.com',
+            extra_claims={
+                'nbf': now - datetime.timedelta(minutes=1),
+                'exp': now + datetime.timedelta(minutes=5),
+            },
+        )
+        payload = core.verify_token(token)
+        self.assertEqual(
+            payload['exp'],
+            int((now + datetime.timedelta(minutes=5)).timestamp()),
+        )
+
+    def test_unserializable_claims_use_pyjwt(self):
+        """Test that claims orjson would encode differently use PyJWT."""
+        for name, value in (
+            ('non-string keys', {1: 'x', None: 'y'}),
+            ('big integer', 2**70),
+            ('nan', float('nan')),
+            ('infinities', [float('inf'), float('-inf')]),
+        ):
+            with self.subTest(name):
+                claims = {**self.claims, 'extra': value}
+                self.assertEqual(
+                    core._encode_token(claims, b's' * 64, 'HS256'),
+                    jwt.encode(claims, 's' * 64, algorithm='HS256'),
+                )
+
+    def test_unserializable_extra_claims_round_trip(self):
+        """Test that claims PyJWT can encode still verify."""
+        token = core.create_access_token(
+            subject='user@example.com',
+            extra_claims={'perms': {1: 'x'}, 'big': 2**70},
+        )
+        payload = core.verify_token(token)
+        self.assertEqual(payload['perms'], {'1': 'x'})
+        self.assertEqual(payload['big'], 2**70)
+
+    def test_nan_claim_round_trips(self):
+        """Test that a NaN claim is kept rather than signed as null."""
+        token = core.create_access_token(
+            subject='user@example.com', extra_claims={'x': float('nan')}
+        )
+        self.assertTrue(math.isnan(core.verify_token(token)['x']))
+
+    def test_non_json_claims_are_rejected_like_pyjwt(self):
+        """Test that values json.dumps rejects raise as with PyJWT."""
+
+        @dataclasses.dataclass
+        class Point:
+            x: int
+
+        class Color(enum.Enum):
+            RED = 'red'
+
+        for name, value in (
+            ('datetime', datetime.datetime.now(datetime.UTC)),
+            ('uuid', uuid.uuid4()),
+            ('dataclass', Point(1)),
+            ('enum', Color.RED),
+        ):
+            with self.subTest(name):
+                claims = {**self.claims, 'extra': value}
+                with self.assertRaises(TypeError):
+                    jwt.encode(claims, 's' * 64, algorithm='HS256')
+                with self.assertRaises(TypeError):
+                    core._encode_token(claims, b's' * 64, 'HS256')
+
+    def test_public_key_secret_is_rejected_like_pyjwt(self):
+        """Test that PEM and SSH public keys are refused as HMAC secrets."""
+        for secret in (
+            b'-----BEGIN PUBLIC KEY-----\n'
+            + b'A' * 64
+            + b'\n-----END PUBLIC KEY-----\n',
+            b'ssh-ed25519 ' + b'A' * 64,
+        ):
+            with self.subTest(secret=secret):
+                with self.assertRaises(jwt.InvalidKeyError):
+                    jwt.encode(self.claims, secret, algorithm='HS256')
+                with self.assertRaises(jwt.InvalidKeyError):
+                    core._encode_token(self.claims, secret, 'HS256')
+
+    def test_hmac_prototype_is_reused_unchanged(self):
+        """Test that repeated signing reuses an unmodified prototype."""
+        first = core._encode_token(self.claims, b'p' * 64, 'HS256')
+        second = core._encode_token(self.claims, b'p' * 64, 'HS256')
+        self.assertEqual(first, second)
+        self.assertIs(
+            core._hmac_prototype(b'p' * 64, 'HS256'),
+            core._hmac_prototype(b'p' * 64, 'HS256'),
+        )
+
+    def test_other_algorithms_use_pyjwt(self):
+        """Test that non-HMAC algorithms are delegated to PyJWT."""
+        with mock.patch.object(core.jwt, 'encode', return_value='t') as enc:
+            self.assertEqual(core._encode_token({}, b'secret', 'none'), 't')
+        enc.assert_called_once_with({}, b'secret', algorithm='none')
+
+
+class TestVerifyTokensBatch(unittest.TestCase):
+    """Test bulk verification of JWT tokens."""
+
+    secret = 's' * 64
+
+    def setUp(self):
+        core.clear_token_cache()
+        self.addCleanup(core.clear_token_cache)
+        self.auth_settings = settings.Auth(jwt_secret=self.secret)
+
+    def _token(self, **overrides: typing.Any) -> str:
+        claims = {
+            'sub': 'user@example.com',
+            'jti': 'abc123',
+            'type': 'access',
+            'iat': 1700000000,
+            'exp': 2**40,
+            **overrides,
+        }
+        return jwt.encode(
+            {k: v for k, v in claims.items() if v is not None},
+            self.secret,
+            algorithm='HS256',
+        )
+
+    def _signed(
+        self, header: bytes, payload: bytes, secret: str | None = None
+    ) -> str:
+        """Return a token signed over raw header and payload JSON."""
+        signing_input = b'.'.join(
+            jwt.utils.base64url_encode(part) for part in (header, payload)
+        )
+        signature = hmac.digest(
+            (secret or self.secret).encode('utf-8'), signing_input, 'sha256'
+        )
+        return b'.'.join(
+            (signing_input, jwt.utils.base64url_encode(signature))
+        ).decode('ascii')
+
+    def test_results_match_verify_token(self):
+        """Test that each result matches what verify_token produces."""
+        tokens = [
+            core.create_access_token('a', auth_settings=self.auth_settings),
+            self._token(),
+            self._token(role='admin'),
+        ]
+        results = core.verify_tokens_batch(tokens, self.auth_settings)
+        core.clear_token_cache()
+        self.assertEqual(
+            results,
+            [core.verify_token(t, self.auth_settings) for t in tokens],
+        )
+
+    def test_invalid_tokens_return_errors(self):
+        """Test that rejected tokens yield the same error types as PyJWT."""
+        valid = self._token()
+        header, payload, _signature = valid.split('.')
+        forged = self._token(role='admin').split('.')[2]
+        header_json = jwt.utils.base64url_decode(header)
+        payload_json = jwt.utils.base64url_decode(payload).decode()
+        cases = {
+            'malformed': ('invalid', jwt.DecodeError),
+            'too many segments': (f'{valid}.x', jwt.DecodeError),
+            'tampered': (
+                f'{header}.{payload}.{forged}',
+                jwt.InvalidSignatureError,
+            ),
+            'wrong algorithm': (
+                jwt.encode({'sub': 'x'}, self.secret, algorithm='HS512'),
+                jwt.InvalidAlgorithmError,
+            ),
+            'expired': (self._token(exp=1), jwt.ExpiredSignatureError),
+            'missing claim': (
+                self._token(jti=None),
+                jwt.MissingRequiredClaimError,
+            ),
+            'future iat': (self._token(iat=2**39), jwt.ImmatureSignatureError),
+            'future nbf': (self._token(nbf=2**39), jwt.ImmatureSignatureError),
+            'audience': (self._token(aud='api'), jwt.InvalidAudienceError),
+            'non-integer exp': (self._token(exp='soon'), jwt.DecodeError),
+            'non-integer iat': (
+                self._token(iat='then'),
+                jwt.InvalidIssuedAtError,
+            ),
+            'non-integer nbf': (self._token(nbf='then'), jwt.DecodeError),
+            'non-string sub': (
+                self._token(sub=1),
+                jwt.exceptions.InvalidSubjectError,
+            ),
+            'non-string jti': (
+                self._token(jti=1),
+                jwt.exceptions.InvalidJTIError,
+            ),
+            'unencoded payload': (
+                self._signed(
+                    b'{"alg":"HS256","b64":false}', payload_json.encode()
+                ),
+                jwt.DecodeError,
+            ),
+            'payload not base64': (
+                self._signed(header_json, b'').replace('..', '.!!!.'),
+                jwt.DecodeError,
+            ),
+            'payload not json': (
+                self._signed(header_json, b'not json'),
+                jwt.DecodeError,
+            ),
+            'payload not an object': (
+                self._signed(header_json, b'[]'),
+                jwt.DecodeError,
+            ),
+        }
+        results = core.verify_tokens_batch(
+            [token for token, _error in cases.values()], self.auth_settings
+        )
+        for (name, (token, error)), result in zip(
+            cases.items(), results, strict=True
+        ):
+            with self.subTest(name):
+                self.assertIsInstance(result, error)
+                with self.assertRaises(error):
+                    core.verify_token(token, self.auth_settings)
+        self.assertEqual(core._token_cache, {})
+
+    def test_unverified_tokens_defer_to_verify_token(self):
+        """Test that tokens not accepted by the fast path use PyJWT."""
+        valid = self._token()
+        header, payload, signature = valid.split('.')
+        # Flipping the unused low bit of the final character leaves the
+        # decoded signature unchanged but the encoding non-canonical
+        alphabet = (
+            'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_'
+        )
+        index = alphabet.index(signature[-1])
+        tokens = [
+            f'{header}.{payload}.{signature[:-1]}{alphabet[index ^ 1]}',
+            f'{header}.{payload}.{signature}+',
+            f'{valid}é',
+            jwt.encode(
+                jwt.decode(valid, options={'verify_signature': False}),
+                self.secret,
+                algorithm='HS256',
+                headers={'kid': 'key-1'},
+            ),
+            # Rejected by PyJWT releases that validate kid when decoding
+            self._signed(
+                b'{"alg":"HS256","typ":"JWT","kid":1}',
+                jwt.utils.base64url_decode(payload),
+            ),
+        ]
+        with mock.patch.object(
+            core, 'verify_token', wraps=core.verify_token
+        ) as verify:
+            results = core.verify_tokens_batch(tokens, self.auth_settings)
+        self.assertEqual(verify.call_count, len(tokens))
+        for token, result in zip(tokens, results, strict=True):
+            with self.subTest(token=token):
+                core.clear_token_cache()
+                try:
+                    expected = core.verify_token(token, self.auth_settings)
+                except jwt.InvalidTokenError as err:
+                    self.assertIsInstance(result, type(err))
+                else:
+                    self.assertEqual(result, expected)
+
+    def test_public_key_secret_is_rejected_like_pyjwt(self):
+        """Test that a PEM public key secret is refused, not cached."""
+        secret = (
+            '-----BEGIN PUBLIC KEY-----\n'
+            + 'A' * 64
+            + '\n-----END PUBLIC KEY-----\n'
+        )
+        auth_settings = settings.Auth(jwt_secret=secret)
+        token = self._signed(
+            b'{"alg":"HS256","typ":"JWT"}',
+            jwt.utils.base64url_decode(self._token().split('.')[1]),
+            secret,
+        )
+        with self.assertRaises(jwt.InvalidKeyError):
+            core.verify_tokens_batch([token], auth_settings)
+        self.assertEqual(core._token_cache, {})
+        with self.assertRaises(jwt.InvalidKeyError):
+            core.verify_token(token, auth_settings)
+
+    def test_shares_verify_token_cache(self):
+        """Test that batch results populate and use the claims cache."""
+        token = self._token()
+        core.verify_tokens_batch([token], self.auth_settings)
+        with mock.patch.object(core.jwt, 'decode') as decode:
+            core.verify_token(token, self.auth_settings)
+        decode.assert_not_called()
+        other = self._token(role='admin')
+        expected = core.verify_token(other, self.auth_settings)
+        with mock.patch.object(core, '_decode_hmac_token') as decode_hmac:
+            results = core.verify_tokens_batch([other], self.auth_settings)
+        decode_hmac.assert_not_called()
+        self.assertEqual(results, [expected])
+
+    def test_other_algorithms_use_verify_token(self):
+        """Test that non-HMAC algorithms are verified one by one."""
+        auth_settings = settings.Auth(
+            jwt_secret=self.secret, jwt_algorithm='RS256'
+        )
+        with mock.patch.object(
+            core, 'verify_token', side_effect=[{'sub': 'a'}, jwt.DecodeError]
+        ) as verify:
+            results = core.verify_tokens_batch(['a', 'b'], auth_settings)
+        self.assertEqual(results[0], {'sub': 'a'})
+        self.assertIsInstance(results[1], jwt.DecodeError)
+        self.assertEqual(verify.call_count, 2)
+
+
 class TestTokenExpiration(unittest.TestCase):
     """Test token expiration handling."""
 
@@ -142,6 +796,17 @@ class TestTokenExpiration(unittest.TestCase):
         time_diff = abs((exp - expected_exp).total_seconds())
         self.assertLess(time_diff, 5)
 
+    def test_refresh_token_lifetime(self):
+        """Test that refresh token lifetime matches settings."""
+        token = core.create_refresh_token(subject='user@example.com')
+        payload = core.verify_token(token)
+
+        self.assertIsInstance(payload['iat'], int)
+        self.assertEqual(
+            payload['exp'] - payload['iat'],
+            settings.get_auth_settings().refresh_token_expire_seconds,
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
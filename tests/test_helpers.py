@@ -14,3 +14,19 @@ class UnwrapAsTestCase(unittest.TestCase):
     def test_fails_with_incorrect_type(self) -> None:
         with self.assertRaises(ValueError):
             helpers.unwrap_as(str, 1)
+
+    def test_succeeds_with_subclass(self) -> None:
+        self.assertIs(helpers.unwrap_as(int, True), True)
+
+
+class UnwrapAsExactTestCase(unittest.TestCase):
+    def test_fails_with_none(self) -> None:
+        with self.assertRaises(ValueError):
+            helpers.unwrap_as_exact(int, None)
+
+    def test_succeeds_with_exact_type(self) -> None:
+        self.assertEqual(helpers.unwrap_as_exact(str, 'value'), 'value')
+
+    def test_fails_with_subclass(self) -> None:
+        with self.assertRaises(ValueError):
+            helpers.unwrap_as_exact(int, True)
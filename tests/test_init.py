@@ -0,0 +1,37 @@
+import subprocess
+import sys
+import unittest
+
+import imbi_common
+
+
+class LazySubmoduleTestCase(unittest.TestCase):
+    def test_import_does_not_load_submodules(self) -> None:
+        result = subprocess.run(
+            [
+                sys.executable,
+                '-c',
+                'import sys, imbi_common; '
+                'print(sorted(m for m in sys.modules '
+                "if m.startswith('imbi_common.')))",
+            ],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+        self.assertEqual(result.stdout.strip(), '[]')
+
+    def test_submodule_attribute_access(self) -> None:
+        from imbi_common import settings
+
+        self.assertIs(imbi_common.settings, settings)
+
+    def test_version(self) -> None:
+        self.assertIsInstance(imbi_common.version, str)
+
+    def test_unknown_attribute_raises(self) -> None:
+        with self.assertRaises(AttributeError):
+            _ = imbi_common.not_a_module
+
+    def test_dir_lists_submodules(self) -> None:
+        self.assertTrue(set(imbi_common.__all__) <= set(dir(imbi_common)))
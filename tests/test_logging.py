@@ -1,7 +1,10 @@
 """Unit tests for logging module."""
 
+import copy
 import logging as stdlib_logging
+import tomllib
 import unittest
+from importlib import resources
 
 from imbi_common import logging
 
@@ -38,6 +41,20 @@ class TestGetLogConfig(unittest.TestCase):
         self.assertIn('loggers', config)
         self.assertIsInstance(config['loggers'], dict)
 
+    def test_matches_bundled_toml(self):
+        """Test that the vendored config matches log-config.toml."""
+        toml_file = resources.files('imbi_common') / 'log-config.toml'
+        self.assertEqual(
+            logging.get_log_config(), tomllib.loads(toml_file.read_text())
+        )
+
+    def test_returns_fresh_dict(self):
+        """Test that mutating a returned config does not leak."""
+        config = logging.get_log_config()
+        config['loggers']['imbi'] = {'level': 'CRITICAL'}
+        self.assertNotEqual(config, logging.get_log_config())
+        self.assertIsNot(config, logging.get_log_config())
+
 
 class TestConfigureLogging(unittest.TestCase):
     """Test configure_logging function."""
@@ -54,6 +71,18 @@ class TestConfigureLogging(unittest.TestCase):
         logger = stdlib_logging.getLogger('imbi')
         self.assertEqual(logger.level, stdlib_logging.DEBUG)
 
+    def test_configure_logging_dev_mode_does_not_mutate_config(self):
+        """Test that dev mode leaves the caller's config untouched."""
+        config = logging.get_log_config()
+        config['loggers']['imbi'] = {'level': 'WARNING'}
+        expected = copy.deepcopy(config)
+
+        logging.configure_logging(log_config=config, dev=True)
+
+        self.assertEqual(config, expected)
+        logger = stdlib_logging.getLogger('imbi')
+        self.assertEqual(logger.level, stdlib_logging.DEBUG)
+
     def test_configure_logging_with_custom_config(self):
         """Test configure_logging with custom config dict."""
         custom_config = {
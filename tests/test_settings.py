@@ -291,6 +291,15 @@ class AuthSettingsTestCase(unittest.TestCase):
         self.assertTrue(config.password_require_digit)
         self.assertTrue(config.password_require_special)
 
+    def test_default_password_hash_parameters(self) -> None:
+        """Test default Argon2id parameters match the OWASP profile."""
+        config = settings.Auth()
+        self.assertEqual(config.password_hash_time_cost, 2)
+        self.assertEqual(config.password_hash_memory_cost, 19456)
+        self.assertEqual(config.password_hash_parallelism, 1)
+        self.assertEqual(config.password_hash_length, 32)
+        self.assertEqual(config.password_salt_length, 16)
+
     def test_auto_generated_jwt_secret(self) -> None:
         """Test JWT secret is auto-generated if not provided."""
         config = settings.Auth()
@@ -0,0 +1,20 @@
+import asyncio
+import typing
+
+from tests import SharedLoopTestCase
+
+
+class SharedLoopTestCaseTestCase(SharedLoopTestCase):
+    loops: typing.ClassVar[set[asyncio.AbstractEventLoop]] = set()
+
+    @classmethod
+    async def async_set_up_class(cls) -> None:
+        cls.loops.add(asyncio.get_running_loop())
+
+    async def test_first(self) -> None:
+        self.loops.add(asyncio.get_running_loop())
+        self.assertEqual(len(self.loops), 1)
+
+    async def test_second(self) -> None:
+        self.loops.add(asyncio.get_running_loop())
+        self.assertEqual(len(self.loops), 1)